@@ -3,18 +3,17 @@
 import sys
 import os
 import json
-import zipfile
-import tempfile
-import shutil
-import xml.etree.ElementTree as ET
+import stat
 
 # Save original stdout for final JSON output
 ORIGINAL_STDOUT_FD = os.dup(1)
 
 # Redirect stdout and stderr to /dev/null BEFORE importing FreeCAD
-devnull_fd = os.open('/dev/null', os.O_WRONLY)
+# (fd-level, so FreeCAD's C++ console output is silenced too - nothing is buffered)
+devnull_fd = os.open(os.devnull, os.O_WRONLY)
 os.dup2(devnull_fd, 1)
 os.dup2(devnull_fd, 2)
+os.close(devnull_fd)
 
 def debug_print(msg):
     """Print debug to original stderr (fd 2) - bypasses all redirection"""
@@ -25,52 +24,65 @@ def debug_print(msg):
 
 debug_print("SCRIPT STARTING - ALL OUTPUT SUPPRESSED")
 
+# orjson is optional - much faster than the stdlib encoder for big results
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+
+def clean_exit(result):
+    """Write JSON to the original stdout, hard exit"""
+    debug_print("Writing JSON output")
+    # Raw fd writes - nothing left in Python buffers for os._exit to drop
+    data = memoryview(_dumps(result) + b"\n")
+    while data:
+        data = data[os.write(ORIGINAL_STDOUT_FD, data):]
+    os._exit(0)
+
+
 # Import FreeCAD with all output muted
 debug_print("Importing FreeCAD modules...")
 try:
     import FreeCAD
     import Part
     import Mesh
-    import MeshPart
-    import Import
     debug_print("FreeCAD modules imported successfully")
 except Exception as e:
-    os.dup2(ORIGINAL_STDOUT_FD, 1)
-    print(json.dumps({
+    clean_exit({
         "success": False,
         "error": f"FreeCAD import failed: {str(e)}",
         "stage": "import"
-    }))
-    sys.exit(0)
+    })
 
 
-def clean_exit(result):
-    """Restore stdout, print JSON, hard exit"""
-    debug_print("Restoring stdout for JSON output")
-    os.dup2(ORIGINAL_STDOUT_FD, 1)
-    sys.stdout = os.fdopen(ORIGINAL_STDOUT_FD, 'w')
-    print(json.dumps(result, indent=2))
-    sys.stdout.flush()
-    os._exit(0)
-
-
-def get_mesh_info(mesh, skip_expensive=False):
+def get_mesh_info(mesh, skip_expensive=False, previous=None):
+    """Collect mesh statistics, reusing the self-intersection result from
+    `previous` when the caller knows it has not changed"""
     debug_print(f"Getting mesh info (skip_expensive={skip_expensive})")
+    solid = mesh.isSolid()
     info = {
         "points": mesh.CountPoints,
         "facets": mesh.CountFacets,
         "edges": mesh.CountEdges,
+        "is_solid": solid,
+        "volume": mesh.Volume if solid else None,
+        "area": mesh.Area,
     }
 
-    info["is_solid"] = mesh.isSolid()
-    info["volume"] = mesh.Volume if info["is_solid"] else None
-    info["area"] = mesh.Area
-
     if not skip_expensive:
         debug_print("Checking non-manifolds...")
         info["has_non_manifolds"] = mesh.hasNonManifolds()
-        debug_print("Checking self-intersections...")
-        info["has_self_intersections"] = mesh.hasSelfIntersections()
+        if previous is not None and "has_self_intersections" in previous:
+            debug_print("Reusing self-intersection result")
+            info["has_self_intersections"] = previous["has_self_intersections"]
+        else:
+            debug_print("Checking self-intersections...")
+            info["has_self_intersections"] = mesh.hasSelfIntersections()
     else:
         debug_print("Skipping expensive checks (large mesh)")
 
@@ -78,69 +90,92 @@ def get_mesh_info(mesh, skip_expensive=False):
 
 
 def repair_mesh(mesh, skip_expensive=False):
+    """Repair mesh in place, returns (mesh, repairs, geometry_changed) -
+    geometry_changed is False if at most the normals were harmonized"""
     debug_print("Starting mesh repair")
     repairs = []
+    geometry_changed = False
 
     before_pts = mesh.CountPoints
     mesh.removeDuplicatedPoints()
     if mesh.CountPoints < before_pts:
         repairs.append(f"Removed {before_pts - mesh.CountPoints} duplicate points")
+        geometry_changed = True
 
     before_f = mesh.CountFacets
     mesh.removeDuplicatedFacets()
     if mesh.CountFacets < before_f:
         repairs.append(f"Removed {before_f - mesh.CountFacets} duplicate facets")
+        geometry_changed = True
 
     if not skip_expensive:
         debug_print("Checking self-intersections for repair...")
         if mesh.hasSelfIntersections():
             debug_print("Fixing self-intersections...")
             mesh.fixSelfIntersections()
-            if not mesh.hasSelfIntersections():
-                repairs.append("Fixed self-intersections")
+            # No re-check: mesh_info_after reports the resulting state
+            repairs.append("Attempted self-intersection fix")
+            geometry_changed = True
     else:
         debug_print("Skipping self-intersection check (large mesh)")
 
+    # The Mesh binding has no degeneration check, so this always runs.
+    # It removes or collapses degenerated facets, so a fix shows in the counts
     debug_print("Fixing degenerations...")
+    before = (mesh.CountPoints, mesh.CountFacets)
     try:
         mesh.fixDegenerations(0.0)
-        repairs.append("Fixed degenerations")
     except:
         try:
             mesh.fixDegenerations()
-            repairs.append("Fixed degenerations")
         except:
             pass
+    if (mesh.CountPoints, mesh.CountFacets) != before:
+        repairs.append("Fixed degenerations")
+        geometry_changed = True
 
     if not skip_expensive:
         debug_print("Removing non-manifolds...")
         if mesh.hasNonManifolds():
             try:
                 mesh.removeNonManifolds()
-                if not mesh.hasNonManifolds():
-                    repairs.append("Removed non-manifolds")
+                repairs.append("Attempted non-manifold removal")
+                geometry_changed = True
             except:
                 pass
     else:
         debug_print("Skipping non-manifolds check (large mesh)")
 
-    debug_print("Filling holes...")
-    try:
-        mesh.fillupHoles(1000)
-        repairs.append("Filled holes")
-    except:
+    # A closed mesh has no open edges, so there are no holes to fill
+    if not mesh.isSolid():
+        debug_print("Filling holes...")
+        before_f = mesh.CountFacets
         try:
-            mesh.fillupHoles()
-            repairs.append("Filled holes")
+            mesh.fillupHoles(1000)
         except:
-            pass
+            try:
+                mesh.fillupHoles()
+            except:
+                pass
+        if mesh.CountFacets != before_f:
+            repairs.append("Filled holes")
+            geometry_changed = True
 
-    debug_print("Harmonizing normals...")
-    mesh.harmonizeNormals()
-    repairs.append("Harmonized normals")
+    if mesh.hasNonUniformOrientedFacets() or mesh.hasInvalidNeighbourhood():
+        debug_print("Harmonizing normals...")
+        mesh.harmonizeNormals()
+        repairs.append("Harmonized normals")
 
     debug_print(f"Mesh repair complete: {len(repairs)} operations")
-    return mesh, repairs
+    return mesh, repairs, geometry_changed
+
+
+# removeSplitter can go quadratic in the face count, so meshes with more
+# facets than this skip face merging (makeShapeFromMesh gives one face per
+# facet, so the facet count is a free stand-in for len(shape.Faces)).
+# 100000 is the cap this script has always used - a low value like 2000
+# would turn merging off for almost every real-world STL
+MERGE_FACE_THRESHOLD = 100000
 
 
 def merge_planar_faces(shape, tolerance=0.01):
@@ -183,6 +218,8 @@ def load_stl_file(input_path):
 
 def parse_3mf_model_xml(model_path):
     """Parse 3dmodel.model XML and extract mesh data with components and build"""
+    import xml.etree.ElementTree as ET
+
     debug_print(f"Parsing 3MF model XML: {model_path}")
     
     try:
@@ -332,6 +369,11 @@ def create_mesh_from_data(vertices, triangles):
 
 def load_3mf_file(input_path):
     """Load 3MF file and return list of meshes (one per object)"""
+    # 3MF-only dependencies, kept out of the STL startup path
+    import zipfile
+    import tempfile
+    import shutil
+
     debug_print("Processing 3MF file...")
     
     temp_dir = tempfile.mkdtemp(prefix='3mf_extract_')
@@ -403,7 +445,49 @@ def load_3mf_file(input_path):
             debug_print(f"Failed to clean up temp directory: {temp_dir}")
 
 
-def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=False, input_format='stl', skip_face_merge=False):
+def make_staging_path(output_path):
+    """Temp file on local storage to export into, or None to write directly"""
+    import tempfile
+
+    # Special outputs (e.g. /dev/null for mesh info) must not be replaced
+    try:
+        if not stat.S_ISREG(os.stat(output_path).st_mode):
+            return None
+    except FileNotFoundError:
+        pass
+    except OSError:
+        # Can't tell what the target is - let the exporter deal with it
+        return None
+
+    fd, path = tempfile.mkstemp(prefix='stepifi_', suffix='.step')
+    os.close(fd)
+    return path
+
+
+def publish_staged(staging_path, output_path):
+    """Move a finished export into place - one sequential copy (or a plain
+    rename on the same filesystem) instead of the writer's many small writes.
+    Returns False if the exporter produced nothing"""
+    import shutil
+
+    try:
+        if os.stat(staging_path).st_size == 0:
+            debug_print("Staged export is empty, not publishing")
+            return False
+    except OSError:
+        debug_print("Staged export is missing, not publishing")
+        return False
+    # mkstemp creates 0600 and move keeps it - give the file the mode a
+    # direct export would have had
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(staging_path, 0o666 & ~umask)
+    debug_print(f"Moving staged export {staging_path} -> {output_path}")
+    shutil.move(staging_path, output_path)
+    return True
+
+
+def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=False, input_format='stl', skip_face_merge=False, merge_threshold=MERGE_FACE_THRESHOLD, finish=clean_exit):
     debug_print("="*60)
     debug_print(f"CONVERSION STARTED")
     debug_print(f"Input: {input_path}")
@@ -412,6 +496,7 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
     debug_print(f"Tolerance: {tolerance}")
     debug_print(f"Repair: {repair}")
     debug_print(f"Skip Face Merge: {skip_face_merge}")
+    debug_print(f"Merge Threshold: {merge_threshold} facets")
     debug_print("="*60)
 
     result = {
@@ -422,10 +507,12 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
         "tolerance": tolerance
     }
 
-    if not os.path.exists(input_path):
+    try:
+        os.stat(input_path)
+    except OSError:
         debug_print("ERROR: Input file not found")
         result["error"] = "Input file not found"
-        clean_exit(result)
+        return finish(result)
 
     # Load mesh based on file format
     try:
@@ -436,12 +523,12 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
     except Exception as e:
         debug_print(f"ERROR: Failed to load {input_format.upper()} file: {e}")
         result["error"] = f"Failed to load {input_format.upper()} file: {str(e)}"
-        clean_exit(result)
+        return finish(result)
 
     if len(meshes) == 0 or (len(meshes) == 1 and meshes[0].CountFacets == 0):
         debug_print("ERROR: Mesh has no facets")
         result["error"] = f"{input_format.upper()} contains no facets"
-        clean_exit(result)
+        return finish(result)
 
     total_facets = sum(m.CountFacets for m in meshes)
     debug_print(f"Processing {len(meshes)} mesh object(s) with {total_facets} total facets")
@@ -461,9 +548,18 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
 
         if repair:
             debug_print(f"Repairing mesh {i+1}...")
-            mesh, repairs = repair_mesh(mesh, skip_expensive=skip_expensive)
+            mesh, repairs, geometry_changed = repair_mesh(mesh, skip_expensive=skip_expensive)
             all_repairs.extend([f"Mesh {i+1}: {r}" for r in repairs])
-            result[f"mesh_info_after_{i}"] = get_mesh_info(mesh, skip_expensive=skip_expensive)
+            if repairs:
+                # Harmonizing normals alone can't change self-intersections
+                result[f"mesh_info_after_{i}"] = get_mesh_info(
+                    mesh,
+                    skip_expensive=skip_expensive,
+                    previous=None if geometry_changed else result[f"mesh_info_before_{i}"]
+                )
+            else:
+                debug_print(f"Mesh {i+1} already clean, reusing mesh info")
+                result[f"mesh_info_after_{i}"] = result[f"mesh_info_before_{i}"]
         
         processed_meshes.append(mesh)
     
@@ -478,14 +574,18 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
     if info_only:
         debug_print("Info-only mode, exiting")
         result["success"] = True
-        clean_exit(result)
+        return finish(result)
 
     debug_print("Creating FreeCAD document...")
     doc = FreeCAD.newDocument("Job")
+    # One-shot export: no undo history, no recomputes while adding the body
+    doc.UndoMode = 0
+    doc.RecomputesFrozen = True
 
     # Convert each mesh to a solid
     solids = []
     shapes = []
+    merged_solids = 0
     
     for i, mesh in enumerate(processed_meshes):
         debug_print(f"Converting mesh {i+1} to shape...")
@@ -505,16 +605,19 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
             solid = Part.makeSolid(shape)
             
             # Merge planar faces on this solid NOW (before compound)
-            if not skip_face_merge and mesh.CountFacets <= 100000:
+            if not skip_face_merge and mesh.CountFacets <= merge_threshold:
                 debug_print(f"Merging planar faces for solid {i+1}...")
                 # Use more aggressive tolerance for merging - multiply by 10
                 merge_tolerance = tolerance * 10.0
                 debug_print(f"Using merge tolerance: {merge_tolerance}")
                 solid, merged = merge_planar_faces(solid, merge_tolerance)
                 if merged:
+                    merged_solids += 1
                     debug_print(f"Solid {i+1} faces merged successfully")
             elif skip_face_merge:
                 debug_print(f"Skipping face merge for solid {i+1} (skip_face_merge=True)")
+            else:
+                debug_print(f"Skipping face merge for solid {i+1} ({mesh.CountFacets} facets > {merge_threshold})")
             
             solids.append(solid)
             debug_print(f"Successfully created solid {i+1}")
@@ -555,7 +658,7 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
 
     # For multi-object 3MF, faces were already merged per-solid
     # Only try compound-level merge for single objects
-    if not skip_face_merge and len(processed_meshes) == 1 and total_facets <= 100000:
+    if not skip_face_merge and len(processed_meshes) == 1 and total_facets <= merge_threshold:
         merge_tolerance = tolerance * 10.0
         debug_print(f"Single object - merging with tolerance: {merge_tolerance}")
         final, merged_ok = merge_planar_faces(final, merge_tolerance)
@@ -564,9 +667,14 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
         debug_print("Skipping final face merge (skip_face_merge=True)")
         result["merged_planar_faces"] = False
     elif len(processed_meshes) > 1:
-        debug_print("Multi-object file - faces already merged per-solid")
-        result["merged_planar_faces"] = True
+        debug_print(f"Multi-object file - {merged_solids} of {len(processed_meshes)} objects merged per-solid")
+        result["merged_planar_faces"] = merged_solids == len(processed_meshes)
         result["merged_per_solid"] = True
+        if merged_solids < len(processed_meshes):
+            result["skipped_merge_reason"] = (
+                f"{len(processed_meshes) - merged_solids} of {len(processed_meshes)} objects not merged "
+                f"(shells, merge failures or more than {merge_threshold} facets)"
+            )
     else:
         debug_print(f"Skipping removeSplitter - mesh too large ({total_facets} facets)")
         result["merged_planar_faces"] = False
@@ -575,17 +683,43 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
     debug_print("Adding object to document...")
     obj = doc.addObject("Part::Feature", "Mesh")
     obj.Shape = final
+    doc.RecomputesFrozen = False
+
+    # Loaded only once an export is really about to happen, so runs that
+    # stop earlier (unreadable or empty input) never import the STEP exporter
+    try:
+        import Import
+    except Exception as e:
+        debug_print(f"ERROR: Import module failed to load: {e}")
+        result["error"] = f"FreeCAD import failed: {str(e)}"
+        return finish(result)
 
     debug_print(f"Exporting to STEP: {output_path}")
-    Import.export([obj], output_path)
+    staging_path = make_staging_path(output_path)
+    published = True
+    try:
+        Import.export([obj], staging_path or output_path)
+        if staging_path:
+            published = publish_staged(staging_path, output_path)
+    finally:
+        if staging_path and os.path.exists(staging_path):
+            os.remove(staging_path)
     debug_print("Export command executed")
 
-    if not os.path.exists(output_path):
+    # Don't fall through to the stat below - it could find an older
+    # file at output_path that this run never replaced
+    if not published:
+        debug_print("ERROR: STEP export produced no data")
+        result["error"] = "STEP export failed"
+        return finish(result)
+
+    try:
+        output_size = os.stat(output_path).st_size
+    except OSError:
         debug_print("ERROR: STEP file was not created")
         result["error"] = "STEP export failed"
-        clean_exit(result)
+        return finish(result)
 
-    output_size = os.path.getsize(output_path)
     debug_print(f"SUCCESS! STEP file created: {output_size} bytes")
 
     result["success"] = True
@@ -600,29 +734,173 @@ def convert(input_path, output_path, tolerance=0.01, repair=True, info_only=Fals
     debug_print("CONVERSION COMPLETE")
     debug_print("="*60)
 
-    clean_exit(result)
+    return finish(result)
+
+
+def _job_flag(job, key, default, true_words, false_words):
+    value = job.get(key, default)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in true_words:
+        return True
+    if isinstance(value, str) and value.lower() in false_words:
+        return False
+    raise ValueError(f"'{key}' must be true/false, got {value!r}")
+
+
+def parse_batch_job(job):
+    """Validate a batch manifest entry and return convert() arguments"""
+    for key in ('input', 'output'):
+        if not isinstance(job.get(key), str) or not job[key]:
+            raise ValueError(f"Job is missing '{key}' path")
+
+    try:
+        tolerance = float(job.get('tolerance', 0.01))
+        merge_threshold = int(job.get('merge_threshold', MERGE_FACE_THRESHOLD))
+    except (TypeError, ValueError):
+        raise ValueError("'tolerance' and 'merge_threshold' must be numbers")
+
+    input_format = str(job.get('format', 'stl')).lower()
+    if input_format not in ('stl', '3mf'):
+        raise ValueError(f"Unsupported format {input_format!r}")
+
+    return {
+        "input_path": job['input'],
+        "output_path": job['output'],
+        "tolerance": tolerance,
+        "repair": _job_flag(job, 'repair', True, ('true', 'repair'), ('false', 'no-repair')),
+        "input_format": input_format,
+        "skip_face_merge": _job_flag(job, 'skip_face_merge', False, ('true', 'skip-merge'), ('false', 'merge')),
+        "merge_threshold": merge_threshold,
+    }
+
+
+def _convert_one(job):
+    """Run one batch manifest entry and return its result instead of exiting"""
+    try:
+        args = parse_batch_job(job)
+    except ValueError as e:
+        return {
+            "success": False,
+            "input": job.get('input'),
+            "output": job.get('output'),
+            "error": f"Invalid batch job: {str(e)}"
+        }
+
+    try:
+        return convert(finish=lambda result: result, **args)
+    except Exception as e:
+        return {
+            "success": False,
+            "input": job.get('input'),
+            "output": job.get('output'),
+            "error": str(e)
+        }
+    finally:
+        # convert() only closes its document on success - don't let failed
+        # jobs pile documents up in a long-lived worker
+        for name in list(FreeCAD.listDocuments()):
+            try:
+                FreeCAD.closeDocument(name)
+            except:
+                pass
+
+
+def _batch_worker(jobs, results):
+    for index, job in iter(jobs.get, None):
+        results.put((index, _convert_one(job)))
+
+
+def convert_batch(manifest_path):
+    """Convert every {input, output, tolerance, ...} entry of a JSON manifest
+    in parallel worker processes"""
+    import multiprocessing
+    import queue
+
+    try:
+        with open(manifest_path) as f:
+            jobs = json.load(f)
+    except Exception as e:
+        return clean_exit({"success": False, "error": f"Failed to read batch manifest: {str(e)}"})
+
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        return clean_exit({"success": False, "error": "Batch manifest must be a JSON list of job objects"})
+
+    # fork rather than spawn: workers inherit the already imported FreeCAD
+    # modules (no re-import per worker) and this script is never re-executed,
+    # which matters because freecadcmd runs it as a plain file, not a module
+    ctx = multiprocessing.get_context('fork')
+    job_queue = ctx.Queue()
+    result_queue = ctx.Queue()
+    for index, job in enumerate(jobs):
+        job_queue.put((index, job))
+
+    worker_count = max(1, min(len(jobs), os.cpu_count() or 1))
+    debug_print(f"Batch: {len(jobs)} job(s) on {worker_count} worker(s)")
+    workers = [ctx.Process(target=_batch_worker, args=(job_queue, result_queue)) for _ in range(worker_count)]
+    for worker in workers:
+        job_queue.put(None)
+        worker.start()
+
+    results = [None] * len(jobs)
+    pending = len(jobs)
+    while pending:
+        try:
+            index, job_result = result_queue.get(timeout=1)
+        except queue.Empty:
+            if not any(worker.is_alive() for worker in workers):
+                break
+            continue
+        results[index] = job_result
+        pending -= 1
+
+    for worker in workers:
+        worker.join(timeout=1)
+
+    for index, job_result in enumerate(results):
+        if job_result is None:
+            results[index] = {
+                "success": False,
+                "input": jobs[index].get('input'),
+                "output": jobs[index].get('output'),
+                "error": "Worker process exited before finishing this job"
+            }
+
+    clean_exit({
+        "success": all(r["success"] for r in results),
+        "results": results
+    })
 
 
 def main():
     debug_print("main() function called")
     debug_print(f"Arguments: {sys.argv}")
 
-    if len(sys.argv) < 4:
+    # Positional keyword, not --batch: freecadcmd rejects unknown --options
+    if len(sys.argv) == 4 and sys.argv[2] == 'batch':
+        convert_batch(sys.argv[3])
+        return
+
+    args = sys.argv
+
+    if len(args) < 4:
         os.dup2(ORIGINAL_STDOUT_FD, 1)
-        print("Usage: freecadcmd script.py input_file output_file [tolerance] [repair|no-repair] [format]")
+        print("Usage: freecadcmd script.py input_file output_file [tolerance] [repair|no-repair] [format] [merge|skip-merge] [merge_threshold]")
+        print("       freecadcmd script.py batch manifest.json")
         sys.exit(1)
 
-    input_file = sys.argv[2]
-    output_file = sys.argv[3]
-    tolerance = float(sys.argv[4]) if len(sys.argv) > 4 else 0.01
-    repair = sys.argv[5].lower() != 'no-repair' if len(sys.argv) > 5 else True
-    input_format = sys.argv[6] if len(sys.argv) > 6 else 'stl'
-    skip_face_merge = sys.argv[7].lower() == 'skip-merge' if len(sys.argv) > 7 else False
+    input_file = args[2]
+    output_file = args[3]
+    tolerance = float(args[4]) if len(args) > 4 else 0.01
+    repair = args[5].lower() != 'no-repair' if len(args) > 5 else True
+    input_format = args[6] if len(args) > 6 else 'stl'
+    skip_face_merge = args[7].lower() == 'skip-merge' if len(args) > 7 else False
+    merge_threshold = int(args[8]) if len(args) > 8 else MERGE_FACE_THRESHOLD
     info_only = False
 
-    debug_print(f"Parsed: input={input_file}, output={output_file}, tol={tolerance}, repair={repair}, format={input_format}, skip_face_merge={skip_face_merge}")
+    debug_print(f"Parsed: input={input_file}, output={output_file}, tol={tolerance}, repair={repair}, format={input_format}, skip_face_merge={skip_face_merge}, merge_threshold={merge_threshold}")
 
-    convert(input_file, output_file, tolerance, repair, info_only, input_format, skip_face_merge)
+    convert(input_file, output_file, tolerance, repair, info_only, input_format, skip_face_merge, merge_threshold)
 
 
 debug_print("Calling main() unconditionally (FreeCAD compatibility)")